@@ -49,16 +49,21 @@ SOFTWARE.
 
 """
 import argparse
+import bisect
 import calendar
 import configparser
 import os
 import re
+import shlex
+import stat
 import subprocess
 import sys
+import threading
 from cmd import Cmd
+from collections import defaultdict
 from datetime import datetime, timedelta, date
+from functools import cached_property, lru_cache
 
-import tzlocal
 from dateutil import parser as dtparser
 from rich import box
 from rich.color import ColorParseError
@@ -67,8 +72,6 @@ from rich.padding import Padding
 from rich.table import Table
 from rich.text import Text
 from rich.style import Style
-from watchdog.events import FileSystemEventHandler
-from watchdog.observers import Observer
 
 APP_NAME = "nrrdjrnl"
 APP_VERS = "0.0.2"
@@ -77,6 +80,8 @@ APP_LICENSE = "Released under MIT license."
 DEFAULT_DATA_DIR = f"$HOME/.local/share/{APP_NAME}"
 DEFAULT_CONFIG_FILE = f"$HOME/.config/{APP_NAME}/config"
 DEFAULT_FIRST_WEEKDAY = 6
+# seconds to wait for file changes to settle before refreshing
+REFRESH_DELAY = 0.25
 DEFAULT_CONFIG = (
     "[main]\n"
     f"data_dir = {DEFAULT_DATA_DIR}\n"
@@ -118,6 +123,123 @@ DEFAULT_CONFIG = (
 )
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso(datestr):
+    """Parse an ISO-format date string, caching the result.
+
+    Args:
+        datestr (str): a date string in ISO format (YYYY-MM-DD).
+
+    Returns:
+        dateobj (date): the parsed date object.
+
+    """
+    return date.fromisoformat(datestr)
+
+
+@lru_cache(maxsize=1024)
+def _parse_freeform(datestr, today):
+    """Parse a free-form date string with dateutil, caching the result.
+
+    Args:
+        datestr (str): a datetime-like string.
+        today (date): the date supplying any fields missing in datestr.
+
+    Returns:
+        dtobj (datetime): the parsed (possibly naive) datetime or None.
+
+    """
+    try:
+        dtobj = dtparser.parse(
+            datestr,
+            default=datetime.combine(today, datetime.min.time()))
+    except (TypeError, ValueError, OverflowError, dtparser.ParserError):
+        dtobj = None
+    return dtobj
+
+
+@lru_cache(maxsize=256)
+def _monthcal(first_weekday, year, month):
+    """Build a month's calendar table, caching the result.
+
+    Args:
+        first_weekday (int): first day of week (0 = Mon, 6 = Sun).
+        year (int): the calendar year.
+        month (int): the calendar month.
+
+    Returns:
+        weeks (tuple): a tuple of weeks, each a tuple of day numbers
+    (0 for days outside the month).
+
+    """
+    cal = calendar.Calendar(firstweekday=first_weekday)
+    return tuple(tuple(week) for week in cal.monthdayscalendar(year, month))
+
+
+def _view_ranges(today, first_weekday):
+    """Compute the date ranges for the list views relative to today.
+
+    Args:
+        today (date): the current date.
+        first_weekday (int): first day of week (0 = Mon, 6 = Sun).
+
+    Returns:
+        views (dict): (range start, range end, title, calendar args)
+    tuples keyed by view name.
+
+    """
+    today_wd = today.weekday()
+    this_year = today.year
+    last_year = this_year - 1
+    this_month = today.month
+    this_month_ld = calendar.monthrange(this_year, this_month)[1]
+    last_month = this_month - 1
+    if last_month == 0:
+        last_month = 12
+        lm_year = this_year - 1
+    else:
+        lm_year = this_year
+    last_month_ld = calendar.monthrange(lm_year, last_month)[1]
+    this_week_start = today - timedelta(
+            days=(today_wd - first_weekday) % 7)
+    this_week_end = this_week_start + timedelta(days=6)
+    last_week_start = this_week_start - timedelta(days=7)
+    last_week_end = last_week_start + timedelta(days=6)
+    views = {
+        "thisweek": (
+            this_week_start,
+            this_week_end,
+            "this week",
+            {'weekstart': this_week_start}),
+        "lastweek": (
+            last_week_start,
+            last_week_end,
+            "last week",
+            {'weekstart': last_week_start}),
+        "thismonth": (
+            date(this_year, this_month, 1),
+            date(this_year, this_month, this_month_ld),
+            "this month",
+            {'month': this_month, 'year': this_year}),
+        "lastmonth": (
+            date(lm_year, last_month, 1),
+            date(lm_year, last_month, last_month_ld),
+            "last month",
+            {'month': last_month, 'year': lm_year}),
+        "thisyear": (
+            date(this_year, 1, 1),
+            date(this_year, 12, 31),
+            "this year",
+            {'year': this_year}),
+        "lastyear": (
+            date(last_year, 1, 1),
+            date(last_year, 12, 31),
+            "last year",
+            {'year': last_year})
+    }
+    return views
+
+
 class Entries():
     """Performs journal entry operations.
 
@@ -137,6 +259,7 @@ class Entries():
         self.data_dir = data_dir
         self.config_dir = os.path.dirname(self.config_file)
         self.dflt_config = dflt_config
+        self._config_mtime = None
         self.interactive = False
 
         # default colors
@@ -152,8 +275,10 @@ class Entries():
         # editor (required for some functions)
         self.editor = os.environ.get("EDITOR")
 
+        # shared console for rendered output
+        self.console = Console()
+
         # defaults
-        self.ltz = tzlocal.get_localzone()
         self.first_weekday = DEFAULT_FIRST_WEEKDAY
         self.show_calendar_week = True
         self.show_calendar_month = True
@@ -171,11 +296,33 @@ class Entries():
         self.style_calendar = None
         self.style_calendar_hl = None
 
+        # calendar names and headers, set after the config file is
+        # parsed for first_weekday
+        self._month_names = None
+        self._weekheader = None
+
+        # rendered month calendars, cleared when entries are refreshed
+        self._cal_cache = {}
+
+        # parsed entries and the file mtimes they were read at
+        self.entries = None
+        self._date_cache = None
+        self._entries_by_date = ([], [])
+        self._file_mtimes = {}
+        # serializes scans from the shell's watchdog timer and commands
+        self._scan_lock = threading.Lock()
+
         self._default_config()
         self._parse_config()
         self._verify_data_dir()
         self._parse_files()
 
+    @cached_property
+    def ltz(self):
+        """The local timezone, looked up on first use."""
+        import tzlocal
+        return tzlocal.get_localzone()
+
     def _create_entry(self, dateobj):
         """Creates a new journal file for a date.
 
@@ -187,12 +334,7 @@ class Entries():
 
         """
         success = False
-        datetxt = str(dateobj)
-        if self.file_ext:
-            date_file = os.path.join(
-                    self.data_dir, f"{datetxt}.{self.file_ext}")
-        else:
-            date_file = os.path.join(self.data_dir, datetxt)
+        date_file = self._entry_path(dateobj)
 
         headline = dateobj.strftime("Journal for %A, %Y-%m-%d")
         default_template = f"{headline}\n\nToday:\n"
@@ -216,15 +358,10 @@ class Entries():
 
         """
         success = False
-        today = str(date.today())
-        if self.file_ext:
-            today_file = os.path.join(
-                    self.data_dir, f"{today}.{self.file_ext}")
-        else:
-            today_file = os.path.join(self.data_dir, today)
+        today = date.today()
+        today_file = self._entry_path(today)
 
-        headline = datetime.now(
-            tz=self.ltz).strftime("Journal for %A, %Y-%m-%d")
+        headline = today.strftime("Journal for %A, %Y-%m-%d")
         default_template = f"{headline}\n\nToday:\n"
 
         if not self.today_template:
@@ -259,13 +396,24 @@ class Entries():
 
         """
         if isinstance(datestr, date):
-            dateobj = datestr.astimezone(tz=self.ltz)
-        else:
-            try:
-                dateobj = dtparser.parse(datestr).astimezone(tz=self.ltz)
-                dateobj = dateobj.date()
-            except (TypeError, ValueError, dtparser.ParserError):
-                dateobj = None
+            return datestr
+        if not isinstance(datestr, str):
+            return None
+        # fast path for ISO-format dates (e.g., entry file names)
+        try:
+            return _parse_iso(datestr)
+        except ValueError:
+            pass
+        # free-form dates fill missing fields from today, so include
+        # the day in the cache key
+        dtobj = _parse_freeform(datestr, date.today())
+        if dtobj is None:
+            return None
+        # only look up the local timezone once a date has been parsed
+        try:
+            dateobj = dtobj.astimezone(tz=self.ltz).date()
+        except (ValueError, OverflowError):
+            dateobj = None
         return dateobj
 
     def _default_config(self):
@@ -283,6 +431,22 @@ class Entries():
                     "Config file doesn't exist "
                     "and can't be created.")
 
+    def _entry_path(self, dateobj):
+        """Builds the path of the journal file for a date.
+
+        Args:
+            dateobj (obj): datetime date object.
+
+        Returns:
+            path (str): the journal file path.
+
+        """
+        if self.file_ext:
+            filename = f"{dateobj}.{self.file_ext}"
+        else:
+            filename = str(dateobj)
+        return os.path.join(self.data_dir, filename)
+
     @staticmethod
     def _error_exit(errormsg):
         """Print an error message and exit with a status of 1
@@ -304,42 +468,42 @@ class Entries():
         """
         print(f'ERROR: {errormsg}.')
 
-    def _generate_month_calendar(self, year, month, entries):
+    def _generate_month_calendar(self, year, month, entry_dates):
         """Generates a formatted monthly calendar with event
         days highlighted.
 
         Args:
             year (int): the calendar year.
             month (int): the calendar month.
-            entries (dict): the events for a datetime range.
+            entry_dates (dict): sets of entry dates keyed by
+        (year, month).
 
         Returns:
             cal_txt (obj): a formatted Text object.
 
         """
-        calendar.setfirstweekday(self.first_weekday)
-        months = list(calendar.month_name)
+        hl_dates = entry_dates.get((year, month), set())
+        cache_key = (year, month, frozenset(hl_dates))
+        cal_txt = self._cal_cache.get(cache_key)
+        if cal_txt is not None:
+            return cal_txt
 
         cal_title_style = Style(color=self.color_calendar,
                                 bold=self.color_bold)
         cal_days_style = Style(color=self.color_calendar,
                                underline=True)
-        month_hdr = Text(f"{months[month]} {year}\n",
+        month_hdr = Text(f"{self._month_names[month]} {year}\n",
                          style=cal_title_style, justify='center')
-        month_day_line = Text(calendar.weekheader(2),
+        month_day_line = Text(self._weekheader,
                               style=cal_days_style)
-        month_txt = Text("")
-        for week in calendar.monthcalendar(year, month):
-            week_txt = Text("")
-            for day in week:
+        # collect the pieces and assemble the Text once at the end
+        cal_parts = [month_hdr, "\n", month_day_line, "\n"]
+        for week in _monthcal(self.first_weekday, year, month):
+            for index, day in enumerate(week):
                 if day == 0:
                     day_txt = "  "
                 else:
-                    highlight = False
-                    for entry in entries:
-                        if date(year, month, day) == entry['date']:
-                            highlight = True
-                    if highlight:
+                    if date(year, month, day) in hl_dates:
                         day_txt = Text(
                                 f"{day:02d}",
                                 style=self.style_calendar_hl)
@@ -347,19 +511,52 @@ class Entries():
                         day_txt = Text(
                                 f"{day:02d}",
                                 style=self.style_calendar)
-                if week.index(day) != week[:-1]:
-                    week_txt = Text.assemble(week_txt, day_txt, " ")
-                else:
-                    week_txt = Text.assemble(week_txt, day_txt)
-            month_txt = Text.assemble(month_txt, week_txt, "\n")
-        cal_txt = Text.assemble(
-            month_hdr,
-            "\n",
-            month_day_line,
-            "\n",
-            month_txt)
+                cal_parts.append(day_txt)
+                if index < len(week) - 1:
+                    cal_parts.append(" ")
+            cal_parts.append("\n")
+        cal_txt = Text.assemble(*cal_parts)
+        self._cal_cache[cache_key] = cal_txt
         return cal_txt
 
+    def _get_contents(self, data):
+        """Reads the contents of a journal entry file on first access
+        and caches them with the entry data, along with the split and
+        lowercased lines used by search().
+
+        Args:
+            data (dict):    the journal entry data.
+
+        Returns:
+            lines (tuple):  the entry lines and lowercased lines, or None
+        if the file can't be read.
+
+        """
+        if data['contents'] is None:
+            try:
+                with open(data['path'], "r",
+                          encoding="utf-8") as entry_file:
+                    # remember the mtime so a refresh can keep the contents
+                    mtime = os.fstat(entry_file.fileno()).st_mtime_ns
+                    contents = entry_file.read()
+            except (OSError, IOError):
+                self._error_pass(
+                    f"failure reading {data['path']} "
+                    "- SKIPPING")
+                return None
+            data['lines'] = contents.split('\n')
+            data['lines_lower'] = [
+                line.lower() for line in data['lines']]
+            data['contents'] = contents
+            name = os.path.basename(data['path'])
+            if self.file_ext:
+                name = name[:-len(self.file_ext) - 1]
+            with self._scan_lock:
+                # a refresh may have replaced this entry in the meantime
+                if self.entries.get(name) is data:
+                    self._file_mtimes[data['path']] = mtime
+        return data['lines'], data['lines_lower']
+
     def _handle_error(self, msg):
         """Reports an error message and conditionally handles error exit
         or notification.
@@ -377,6 +574,11 @@ class Entries():
         """Read and parse the configuration file."""
         config = configparser.ConfigParser()
         if os.path.isfile(self.config_file):
+            # skip re-parsing if the file hasn't changed since last read
+            config_mtime = os.stat(self.config_file).st_mtime_ns
+            if config_mtime == self._config_mtime:
+                return
+            self._config_mtime = config_mtime
             try:
                 config.read(self.config_file)
             except configparser.Error:
@@ -402,6 +604,8 @@ class Entries():
                                 config["main"].get("first_weekday"))
                     except ValueError:
                         self.first_weekday = DEFAULT_FIRST_WEEKDAY
+                    if not 0 <= self.first_weekday <= 6:
+                        self.first_weekday = DEFAULT_FIRST_WEEKDAY
 
                 if config["main"].get("show_calendar_week"):
                     try:
@@ -470,6 +674,14 @@ class Entries():
 
             # apply default colors
             _apply_colors()
+            applied_colors = (
+                self.color_title,
+                self.color_border,
+                self.color_date,
+                self.color_dateheader,
+                self.color_calendar,
+                self.color_calendar_hl,
+                self.color_bold)
 
             if "colors" in config:
                 # custom colors with fallback to defaults
@@ -510,10 +722,23 @@ class Entries():
                     self.color_bold = False
 
                 # try to apply requested custom colors
-                _apply_colors()
+                custom_colors = (
+                    self.color_title,
+                    self.color_border,
+                    self.color_date,
+                    self.color_dateheader,
+                    self.color_calendar,
+                    self.color_calendar_hl,
+                    self.color_bold)
+                if custom_colors != applied_colors:
+                    _apply_colors()
         else:
             self._error_exit("Config file not found")
 
+        calendar.setfirstweekday(self.first_weekday)
+        self._month_names = list(calendar.month_name)
+        self._weekheader = calendar.weekheader(2)
+
     def _parse_files(self):
         """ Read journal entry files from `data_dir` and parse event
         data into`events`.
@@ -523,45 +748,58 @@ class Entries():
 
         """
         temp_entries = {}
+        prev_entries = self.entries or {}
+        file_mtimes = {}
+        self._cal_cache = {}
+        if self.file_ext:
+            ext_suffix = f".{self.file_ext}"
+            ext_strip_len = -len(ext_suffix)
+        else:
+            ext_suffix = ""
+            ext_strip_len = None
 
         with os.scandir(self.data_dir) as entries:
             for entry in entries:
                 entrydt = None
-                if self.file_ext:
-                    if (entry.name.endswith(f".{self.file_ext}") and
-                            entry.is_file()):
-                        name = entry.name.replace(f".{self.file_ext}", '')
-                        entrydt = self._date_or_none(name)
-                else:
-                    if entry.is_file():
-                        name = entry.name
-                        entrydt = self._date_or_none(name)
+                # check the name first, is_file() may need a stat()
+                if entry.name.endswith(ext_suffix) and entry.is_file():
+                    name = entry.name[:ext_strip_len]
+                    entrydt = self._date_or_none(name)
                 if entrydt:
-                    try:
-                        with open(entry.path, "r",
-                                  encoding="utf-8") as entry_file:
-                            contents = entry_file.read()
-                    except (OSError, IOError):
-                        self._error_pass(
-                            f"failure reading {entry.path} "
-                            "- SKIPPING")
-                    else:
+                    data = None
+                    # on a refresh, reuse unchanged entries to keep
+                    # cached contents (the first scan skips the stat())
+                    if prev_entries:
+                        try:
+                            mtime = entry.stat().st_mtime_ns
+                        except OSError:
+                            continue
+                        file_mtimes[entry.path] = mtime
+                        data = prev_entries.get(name)
+                        if (data and
+                                (data['path'] != entry.path or
+                                 self._file_mtimes.get(entry.path) != mtime)):
+                            data = None
+                    if not data:
+                        # contents are read on demand by _get_contents()
                         data = {}
                         data['date'] = entrydt
                         data['path'] = entry.path
-                        data['contents'] = contents
-                        temp_entries[name] = data
+                        data['contents'] = None
+                    temp_entries[name] = data
+
+        # forget files that no longer exist
+        self._file_mtimes = file_mtimes
 
         # sort the journal entries by date
-        fifoentries = {}
-        for entry in temp_entries:
-            sort = temp_entries[entry].get('date')
-            fifoentries[entry] = sort
-        sortlist = sorted(fifoentries.items(), key=lambda x: x[1])
-        sorted_entries = dict(sortlist)
-        self.entries = {}
-        for key in sorted_entries.keys():
-            self.entries[key] = temp_entries[key]
+        self.entries = dict(
+            sorted(temp_entries.items(), key=lambda x: x[1]['date']))
+        # date-ordered entries and their dates, for range lookups. set
+        # together, as the shell may refresh from the watchdog thread
+        sorted_entries = list(self.entries.values())
+        self._entries_by_date = (
+            sorted_entries,
+            [data['date'] for data in sorted_entries])
 
     def _print_entries_list(
             self,
@@ -586,7 +824,12 @@ class Entries():
         'excerpt' field, added by search()).
 
         """
-        console = Console()
+        console = self.console
+        # entry dates by month, for calendar highlighting
+        entry_dates = defaultdict(set)
+        for entry in entries:
+            entry_dates[(entry['date'].year, entry['date'].month)].add(
+                entry['date'])
         title = f"Entries - {view}"
         # table
         entry_table = Table(
@@ -605,13 +848,8 @@ class Entries():
         if (view.endswith("week") and
                 weekstart and
                 self.show_calendar_week):
-            day1 = weekstart
-            day2 = weekstart + timedelta(days=1)
-            day3 = weekstart + timedelta(days=2)
-            day4 = weekstart + timedelta(days=3)
-            day5 = weekstart + timedelta(days=4)
-            day6 = weekstart + timedelta(days=5)
-            day7 = weekstart + timedelta(days=6)
+            weekdays = [weekstart + timedelta(days=offset)
+                        for offset in range(7)]
             week_table = Table(
                 title=None,
                 box=box.SQUARE,
@@ -622,66 +860,20 @@ class Entries():
                 pad_edge=True,
                 collapse_padding=False,
                 padding=(0, 0, 0, 0))
-            week_table.add_column(
-                day1.strftime("%a"),
-                justify="center",
-                no_wrap=True,
-                style=self.style_date)
-            week_table.add_column(
-                day2.strftime("%a"),
-                justify="center",
-                no_wrap=True,
-                style=self.style_date)
-            week_table.add_column(
-                day3.strftime("%a"),
-                justify="center",
-                no_wrap=True,
-                style=self.style_date)
-            week_table.add_column(
-                day4.strftime("%a"),
-                justify="center",
-                no_wrap=True,
-                style=self.style_date)
-            week_table.add_column(
-                day5.strftime("%a"),
-                justify="center",
-                no_wrap=True,
-                style=self.style_date)
-            week_table.add_column(
-                day6.strftime("%a"),
-                justify="center",
-                no_wrap=True,
-                style=self.style_date)
-            week_table.add_column(
-                day7.strftime("%a"),
-                justify="center",
-                no_wrap=True,
-                style=self.style_date)
-            daytxt = {}
-            day = 1
-            for weekday in [day1, day2, day3, day4, day5, day6, day7]:
-                highlight = False
-                for entry in entries:
-                    if weekday == entry['date']:
-                        highlight = True
-                if highlight:
-                    daytxt[day] = Text(
-                            weekday.strftime("%m-%d"),
-                            style=self.style_calendar_hl)
-                else:
-                    daytxt[day] = Text(
-                            weekday.strftime("%m-%d"),
-                            style=self.style_calendar)
-                day += 1
-
-            week_table.add_row(
-                daytxt[1],
-                daytxt[2],
-                daytxt[3],
-                daytxt[4],
-                daytxt[5],
-                daytxt[6],
-                daytxt[7])
+            for weekday in weekdays:
+                week_table.add_column(
+                    weekday.strftime("%a"),
+                    justify="center",
+                    no_wrap=True,
+                    style=self.style_date)
+            hl_dates = {entry['date'] for entry in entries}
+            week_table.add_row(*[
+                Text(
+                    weekday.strftime("%m-%d"),
+                    style=(self.style_calendar_hl
+                           if weekday in hl_dates
+                           else self.style_calendar))
+                for weekday in weekdays])
             entry_table.add_row(week_table)
             entry_table.add_row(" ")
         elif (view.endswith('month') and
@@ -696,16 +888,15 @@ class Entries():
                 show_lines=False,
                 pad_edge=True,
                 collapse_padding=False,
-                padding=(1, 0, 0, 1))
+                padding=(1, 1, 0, 1))
             month_table.add_column("single")
             month_table.add_row(
-                    self._generate_month_calendar(year, month, entries))
+                    self._generate_month_calendar(year, month, entry_dates))
             entry_table.add_row(month_table)
             entry_table.add_row(" ")
         elif (view.endswith('year') and
                 year and
                 self.show_calendar_year):
-            calendar.setfirstweekday(self.first_weekday)
             year_table = Table(
                 title=None,
                 box=box.SQUARE,
@@ -714,77 +905,23 @@ class Entries():
                 show_lines=True,
                 pad_edge=True,
                 collapse_padding=False,
-                padding=(1, 0, 0, 1))
+                padding=(1, 1, 0, 1))
+            # four, three or two-column calendar view
             if console.width >= 95:
-                # four-column calendar view
-                year_table.add_column("one")
-                year_table.add_column("two")
-                year_table.add_column("three")
-                year_table.add_column("four")
-                year_table.add_row(
-                    self._generate_month_calendar(year, 1, entries),
-                    self._generate_month_calendar(year, 2, entries),
-                    self._generate_month_calendar(year, 3, entries),
-                    self._generate_month_calendar(year, 4, entries))
-                year_table.add_row(
-                    self._generate_month_calendar(year, 5, entries),
-                    self._generate_month_calendar(year, 6, entries),
-                    self._generate_month_calendar(year, 7, entries),
-                    self._generate_month_calendar(year, 8, entries))
-                year_table.add_row(
-                    self._generate_month_calendar(year, 9, entries),
-                    self._generate_month_calendar(year, 10, entries),
-                    self._generate_month_calendar(year, 11, entries),
-                    self._generate_month_calendar(year, 12, entries))
-                entry_table.add_row(year_table)
-                entry_table.add_row(" ")
+                columns = 4
             elif console.width >= 72:
-                # three-column calendar view
-                year_table.add_column("one")
-                year_table.add_column("two")
-                year_table.add_column("three")
-                year_table.add_row(
-                    self._generate_month_calendar(year, 1, entries),
-                    self._generate_month_calendar(year, 2, entries),
-                    self._generate_month_calendar(year, 3, entries))
-                year_table.add_row(
-                    self._generate_month_calendar(year, 4, entries),
-                    self._generate_month_calendar(year, 5, entries),
-                    self._generate_month_calendar(year, 6, entries))
-                year_table.add_row(
-                    self._generate_month_calendar(year, 7, entries),
-                    self._generate_month_calendar(year, 8, entries),
-                    self._generate_month_calendar(year, 9, entries))
-                year_table.add_row(
-                    self._generate_month_calendar(year, 10, entries),
-                    self._generate_month_calendar(year, 11, entries),
-                    self._generate_month_calendar(year, 12, entries))
-                entry_table.add_row(year_table)
-                entry_table.add_row(" ")
+                columns = 3
             else:
-                # two-column calendar view
-                year_table.add_column("one")
-                year_table.add_column("two")
-                year_table.add_row(
-                    self._generate_month_calendar(year, 1, entries),
-                    self._generate_month_calendar(year, 2, entries))
-                year_table.add_row(
-                    self._generate_month_calendar(year, 3, entries),
-                    self._generate_month_calendar(year, 4, entries))
-                year_table.add_row(
-                    self._generate_month_calendar(year, 5, entries),
-                    self._generate_month_calendar(year, 6, entries))
-                year_table.add_row(
-                    self._generate_month_calendar(year, 7, entries),
-                    self._generate_month_calendar(year, 8, entries))
-                year_table.add_row(
-                    self._generate_month_calendar(year, 9, entries),
-                    self._generate_month_calendar(year, 10, entries))
-                year_table.add_row(
-                    self._generate_month_calendar(year, 11, entries),
-                    self._generate_month_calendar(year, 12, entries))
-                entry_table.add_row(year_table)
-                entry_table.add_row(" ")
+                columns = 2
+            for column in range(columns):
+                year_table.add_column(f"col{column + 1}")
+            month_cals = [
+                self._generate_month_calendar(year, month, entry_dates)
+                for month in range(1, 13)]
+            for index in range(0, 12, columns):
+                year_table.add_row(*month_cals[index:index + columns])
+            entry_table.add_row(year_table)
+            entry_table.add_row(" ")
         # event list
         if entries:
             for entry in entries:
@@ -798,33 +935,37 @@ class Entries():
                         entry_table.add_row(excerpttxt)
         else:
             entry_table.add_row("None")
-        # single-column layout
-        layout = Table.grid()
-        layout.add_column("single")
-        layout.add_row("")
-        layout.add_row(entry_table)
-
-        # render the output with a pager if -p
+        # render the output (after a blank line) with a pager if -p
         if pager:
             if self.color_pager:
                 with console.pager(styles=True):
-                    console.print(layout)
+                    console.print()
+                    console.print(entry_table)
             else:
                 with console.pager():
-                    console.print(layout)
+                    console.print()
+                    console.print(entry_table)
         else:
-            console.print(layout)
+            console.print()
+            console.print(entry_table)
 
     def _verify_data_dir(self):
         """Create the journal data directory if it doesn't exist."""
-        if not os.path.exists(self.data_dir):
+        try:
+            data_dir_stat = os.stat(self.data_dir)
+        except FileNotFoundError:
             try:
                 os.makedirs(self.data_dir)
             except IOError:
                 self._error_exit(
                     f"{self.data_dir} doesn't exist "
                     "and can't be created")
-        elif not os.path.isdir(self.data_dir):
+            return
+        except OSError:
+            self._error_exit(
+                f"{self.data_dir} doesn't exist "
+                "and can't be created")
+        if not stat.S_ISDIR(data_dir_stat.st_mode):
             self._error_exit(f"{self.data_dir} is not a directory")
         elif not os.access(self.data_dir,
                            os.R_OK | os.W_OK | os.X_OK):
@@ -843,6 +984,12 @@ class Entries():
         if entry_data:
             if force:
                 confirm = "yes"
+            elif not sys.stdin.isatty():
+                # don't block scripts waiting for a confirmation
+                self._handle_error(
+                    "confirmation requires a terminal, use '--force' "
+                    "to delete without confirmation")
+                return
             else:
                 confirm = input(f"Delete '{entry}'? [yes/no]: ").lower()
             if confirm in ['yes', 'y']:
@@ -865,9 +1012,12 @@ class Entries():
         """Edit the config file (using $EDITOR) and then reload config."""
         if self.editor:
             try:
-                subprocess.run(
-                    [self.editor, self.config_file], check=True)
-            except subprocess.SubprocessError:
+                # $EDITOR may include its own options
+                editorcmd = shlex.split(self.editor)
+                editorcmd.append(self.config_file)
+                subprocess.run(editorcmd, check=True)
+            except (IOError, OSError, ValueError,
+                    subprocess.SubprocessError):
                 self._handle_error("failure editing config file")
             else:
                 if self.interactive:
@@ -893,7 +1043,7 @@ class Entries():
         if entry == 'today':
             is_today = True
             entry = str(today)
-            if entry not in self.entries.keys():
+            if entry not in self.entries:
                 created = self._create_today()
                 if not created:
                     self._handle_error(
@@ -901,7 +1051,7 @@ class Entries():
         elif entry == 'yesterday':
             entry = str(yesterday)
         else:
-            if entry not in self.entries.keys():
+            if entry not in self.entries:
                 if dateobj:
                     print(f"Entry for {entry} doesn't exist.")
                     add_new = input(
@@ -938,23 +1088,26 @@ class Entries():
             if self.editor:
                 filename = entry_data.get('path')
                 if filename:
-                    if self.today_options and is_today:
-                        editorcmd = (
-                            f"{self.editor} {self.today_options} {filename}"
-                        )
-                    else:
-                        editorcmd = f"{self.editor} {filename}"
                     try:
+                        # split $EDITOR too, it may include its own options
+                        editorcmd = shlex.split(self.editor)
+                        if self.today_options and is_today:
+                            editorcmd.extend(
+                                shlex.split(self.today_options))
+                        editorcmd.append(filename)
                         if is_today:
-                            now = datetime.now(
-                                    tz=self.ltz).strftime(" - %H:%M: ")
-                            with open(filename, 'a') as entry_file:
-                                entry_file.write(now)
-                        subprocess.run(
-                                editorcmd,
-                                check=True,
-                                shell=True)
-                    except (IOError, OSError, subprocess.SubprocessError):
+                            now = datetime.now(tz=self.ltz)
+                            now = f" - {now.hour:02d}:{now.minute:02d}: "
+                            # a single unbuffered append of the timestamp
+                            entry_fd = os.open(
+                                filename, os.O_WRONLY | os.O_APPEND)
+                            try:
+                                os.write(entry_fd, now.encode('utf-8'))
+                            finally:
+                                os.close(entry_fd)
+                        subprocess.run(editorcmd, check=True)
+                    except (IOError, OSError, ValueError,
+                            subprocess.SubprocessError):
                         self._handle_error(f"failure opening file {filename}")
                 else:
                     self._handle_error(f"failed to find file for {entry}")
@@ -983,112 +1136,34 @@ class Entries():
         start = self._date_or_none(start)
         end = self._date_or_none(end)
         view = view.lower()
-        cal = calendar.Calendar(firstweekday=self.first_weekday)
-        today = date.today()
-        today_wd = today.weekday()
-        this_year = today.year
-        last_year = this_year - 1
-        this_month = today.month
-        this_month_ld = calendar.monthrange(this_year, this_month)[1]
-        last_month = this_month - 1
-        if last_month == 0:
-            last_month = 12
-            lm_year = this_year - 1
+        # view date ranges only change with the day (or first_weekday)
+        range_key = (date.today(), self.first_weekday)
+        if not self._date_cache or self._date_cache[0] != range_key:
+            self._date_cache = (range_key, _view_ranges(*range_key))
+        views = self._date_cache[1]
+        if view == "custom" and start and end:
+            spec = (start, end, f"custom\n[{startstr} - {endstr}]", {})
         else:
-            lm_year = this_year
-        last_month_ld = calendar.monthrange(lm_year, last_month)[1]
-        this_week_start = today - timedelta(
-                days=list(cal.iterweekdays()).index(today_wd))
-        this_week_end = this_week_start + timedelta(days=6)
-        last_week_start = this_week_start - timedelta(days=7)
-        last_week_end = last_week_start + timedelta(days=6)
-        if view == "thisweek":
-            selected_entries = []
-            for entry in self.entries:
-                data = self.entries[entry]
-                if this_week_start <= data['date'] <= this_week_end:
-                    selected_entries.append(data)
-            self._print_entries_list(
-                selected_entries, "this week", page, this_week_start)
-        elif view == "lastweek":
-            selected_entries = []
-            for entry in self.entries:
-                data = self.entries[entry]
-                if last_week_start <= data['date'] <= last_week_end:
-                    selected_entries.append(data)
-            self._print_entries_list(
-                    selected_entries, "last week", page, last_week_start)
-        elif view == "thismonth":
-            selected_entries = []
-            this_month_start = date(this_year, this_month, 1)
-            this_month_end = date(this_year, this_month, this_month_ld)
-            for entry in self.entries:
-                data = self.entries[entry]
-                if this_month_start <= data['date'] <= this_month_end:
-                    selected_entries.append(data)
-            self._print_entries_list(
-                    selected_entries,
-                    "this month",
-                    page,
-                    month=this_month,
-                    year=this_year)
-        elif view == "lastmonth":
-            selected_entries = []
-            last_month_start = date(lm_year, last_month, 1)
-            last_month_end = date(lm_year, last_month, last_month_ld)
-            for entry in self.entries:
-                data = self.entries[entry]
-                if last_month_start <= data['date'] <= last_month_end:
-                    selected_entries.append(data)
-            self._print_entries_list(
-                    selected_entries,
-                    "last month",
-                    page,
-                    month=last_month,
-                    year=lm_year)
-        elif view == "thisyear":
-            selected_entries = []
-            this_year_start = date(this_year, 1, 1)
-            this_year_end = date(this_year, 12, 31)
-            for entry in self.entries:
-                data = self.entries[entry]
-                if this_year_start <= data['date'] <= this_year_end:
-                    selected_entries.append(data)
-            self._print_entries_list(
-                    selected_entries,
-                    "this year",
-                    page,
-                    year=this_year)
-        elif view == "lastyear":
-            selected_entries = []
-            last_year_start = date(last_year, 1, 1)
-            last_year_end = date(last_year, 12, 31)
-            for entry in self.entries:
-                data = self.entries[entry]
-                if last_year_start <= data['date'] <= last_year_end:
-                    selected_entries.append(data)
+            spec = views.get(view)
+        if spec:
+            range_start, range_end, title, cal_args = spec
+            sorted_entries, sorted_dates = self._entries_by_date
+            low = bisect.bisect_left(sorted_dates, range_start)
+            high = bisect.bisect_right(sorted_dates, range_end)
+            selected_entries = sorted_entries[low:high]
             self._print_entries_list(
                     selected_entries,
-                    "last year",
+                    title,
                     page,
-                    year=last_year)
-        elif view == "custom" and start and end:
-            selected_entries = []
-            for entry in self.entries:
-                data = self.entries[entry]
-                if start <= data['date'] <= end:
-                    selected_entries.append(data)
-            self._print_entries_list(
-                    selected_entries,
-                    f"custom\n[{startstr} - {endstr}]",
-                    page)
+                    **cal_args)
         else:
             self._handle_error(
                 "invalid view name or custom date/time range")
 
     def refresh(self):
         """Public method to refresh data."""
-        self._parse_files()
+        with self._scan_lock:
+            self._parse_files()
 
     def search(self, term, pager=False):
         """Perform a search for entries that match a given term and
@@ -1101,8 +1176,8 @@ class Entries():
 
         """
         # check for regular expression
-        if term.startswith('/') and term.endswith('/'):
-            test_term = term[1:-2]
+        if term.startswith('/') and term.endswith('/') and len(term) > 2:
+            test_term = term[1:-1]
             try:
                 r_term = re.compile(test_term)
             except re.error:
@@ -1115,19 +1190,26 @@ class Entries():
         else:
             regex = False
         if term:
+            if regex:
+                r_search = term.search
+            else:
+                term_lower = term.lower()
             result_events = []
-            for entry in self.entries:
-                data = self.entries[entry]
-                contents = data['contents'].split('\n')
-                matches = []
-                for line in contents:
-                    if regex:
-                        r_match = re.search(term, line)
-                        if r_match:
-                            matches.append(line.strip())
-                    else:
-                        if term.lower() in line.lower():
-                            matches.append(line.strip())
+            # the shell may swap in refreshed entries while searching
+            entries = self.entries
+            for data in entries.values():
+                lines = self._get_contents(data)
+                if lines is None:
+                    continue
+                lines, lines_lower = lines
+                if regex:
+                    matches = [
+                        line.strip() for line in lines if r_search(line)]
+                else:
+                    matches = [
+                        lines[index].strip()
+                        for index, line_lower in enumerate(lines_lower)
+                        if term_lower in line_lower]
                 if matches:
                     data['excerpt'] = '\n'.join(matches)
                     result_events.append(data)
@@ -1138,8 +1220,10 @@ class Entries():
                     excerpt=True)
 
 
-class FSHandler(FileSystemEventHandler):
+class FSHandler():
     """Handler to watch for file changes and refresh data from files.
+    Implements the watchdog event handler interface (dispatch()) so that
+    watchdog is only imported when the shell starts.
 
     Attributes:
         shell (obj):    the calling shell object.
@@ -1148,15 +1232,37 @@ class FSHandler(FileSystemEventHandler):
     def __init__(self, shell):
         """Initializes an FSHandler() object."""
         self.shell = shell
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def dispatch(self, event):
+        """Dispatch a file system event from the watchdog observer.
+
+        Args:
+            event (obj):    file system event.
+
+        """
+        self.on_any_event(event)
 
     def on_any_event(self, event):
-        """Refresh data in memory on data file changes.
+        """Refresh data in memory on data file changes. Bursts of
+        events (e.g., an editor saving a file) are coalesced into a
+        single refresh after REFRESH_DELAY seconds without changes.
+
         Args:
             event (obj):    file system event.
+
         """
         if event.event_type in [
                 'created', 'modified', 'deleted', 'moved']:
-            self.shell.do_refresh("silent")
+            with self._lock:
+                if self._timer:
+                    self._timer.cancel()
+                self._timer = threading.Timer(
+                    REFRESH_DELAY,
+                    self.shell.entries.refresh)
+                self._timer.daemon = True
+                self._timer.start()
 
 
 class EntriesShell(Cmd):
@@ -1176,15 +1282,14 @@ class EntriesShell(Cmd):
         super().__init__()
         self.entries = entries
 
-        # start watchdog for data_dir changes
-        # and perform refresh() on changes
-        observer = Observer()
-        handler = FSHandler(self)
-        observer.schedule(
-                handler,
-                self.entries.data_dir,
-                recursive=True)
-        observer.start()
+        # watchdog observer for data_dir, started by _ensure_watch()
+        self._observer = None
+
+        # command aliases resolved to bound methods
+        self._alias_dispatch = {
+            alias: (getattr(self, f"do_{command}"), command_args)
+            for alias, (command, command_args)
+            in self._ALIAS_TABLE.items()}
 
         # class overrides for Cmd
         if stdin is not None:
@@ -1214,6 +1319,27 @@ class EntriesShell(Cmd):
             f"Enter command (or 'help')\n"
         )
 
+    # command aliases: (command, arguments)
+    _ALIAS_TABLE = {
+        "quit": ("exit", ""),
+        "lsc": ("list", "custom"),
+        "lsc |": ("list", "custom |"),
+        "lstw": ("list", "thisweek"),
+        "lstw |": ("list", "thisweek |"),
+        "lspw": ("list", "lastweek"),
+        "lspw |": ("list", "lastweek |"),
+        "lstm": ("list", "thismonth"),
+        "lstm |": ("list", "thismonth |"),
+        "lspm": ("list", "lastmonth"),
+        "lspm |": ("list", "lastmonth |"),
+        "lsty": ("list", "thisyear"),
+        "lsty |": ("list", "thisyear |"),
+        "lspy": ("list", "lastyear"),
+        "lspy |": ("list", "lastyear |"),
+        "otd": ("open", "today"),
+        "opd": ("open", "yesterday")
+    }
+
     # class method overrides
     def default(self, args):
         """Handle command aliases and unknown commands.
@@ -1222,36 +1348,10 @@ class EntriesShell(Cmd):
             args (str): the command arguments.
 
         """
-        if args == "quit":
-            self.do_exit("")
-        elif args == "lsc":
-            self.do_list("custom")
-        elif args == "lsc |":
-            self.do_list("custom |")
-        elif args == "lstw":
-            self.do_list("thisweek")
-        elif args == "lstw |":
-            self.do_list("thisweek |")
-        elif args == "lspw":
-            self.do_list("lastweek")
-        elif args == "lspw |":
-            self.do_list("lastweek |")
-        elif args == "lstm":
-            self.do_list("thismonth")
-        elif args == "lstm |":
-            self.do_list("thismonth |")
-        elif args == "lspm":
-            self.do_list("lastmonth")
-        elif args == "lspm |":
-            self.do_list("lastmonth |")
-        elif args == "lsty":
-            self.do_list("thisyear")
-        elif args == "lsty |":
-            self.do_list("thisyear |")
-        elif args == "lspy":
-            self.do_list("lastyear")
-        elif args == "lspy |":
-            self.do_list("lastyear |")
+        alias = self._alias_dispatch.get(args)
+        if alias:
+            command, command_args = alias
+            command(command_args)
         elif args.startswith("ls"):
             newargs = args.split()
             if len(newargs) > 1:
@@ -1264,16 +1364,32 @@ class EntriesShell(Cmd):
                 self.do_delete(newargs[1])
             else:
                 self.do_delete("")
-        elif args == "otd":
-            self.do_open("today")
-        elif args == "opd":
-            self.do_open("yesterday")
         else:
             print("\nNo such command. See 'help'.\n")
 
     def emptyline(self):
         """Ignore empty line entry."""
 
+    def _ensure_watch(self):
+        """Start watchdog for data_dir changes and perform refresh() on
+        changes, if not already started. This is deferred until a
+        command that modifies entry files is used.
+        """
+        if self._observer:
+            return
+        from watchdog.observers import Observer
+        with os.scandir(self.entries.data_dir) as dir_entries:
+            recursive = any(
+                dir_entry.is_dir() for dir_entry in dir_entries)
+        observer = Observer()
+        handler = FSHandler(self)
+        observer.schedule(
+                handler,
+                self.entries.data_dir,
+                recursive=recursive)
+        observer.start()
+        self._observer = observer
+
     def _set_prompt(self):
         """Set the prompt string."""
         if self.entries.color_bold:
@@ -1289,7 +1405,12 @@ class EntriesShell(Cmd):
             args (str): the command arguments, ignored.
 
         """
-        os.system("cls" if os.name == "nt" else "clear")
+        if os.name == "nt":
+            os.system("cls")
+        else:
+            # move home, clear the screen and the scrollback buffer
+            sys.stdout.write("\033[H\033[2J\033[3J")
+            sys.stdout.flush()
 
     def do_config(self, args):
         """Edit the config file and reload the configuration.
@@ -1298,6 +1419,7 @@ class EntriesShell(Cmd):
             args (str): the command arguments, ignored.
 
         """
+        self._ensure_watch()
         self.entries.edit_config()
 
     def do_delete(self, args):
@@ -1307,6 +1429,7 @@ class EntriesShell(Cmd):
             args (str):     the command arguments.
 
         """
+        self._ensure_watch()
         if len(args) > 0:
             commands = args.split()
             self.entries.delete(str(commands[0]).lower())
@@ -1366,6 +1489,7 @@ class EntriesShell(Cmd):
             args (str):     the command arguments.
 
         """
+        self._ensure_watch()
         if len(args) > 0:
             commands = args.split()
             self.entries.open(str(commands[0]).lower())